@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Check request coalescing in OpenNotebookClient under concurrency.
+Runs offline: HTTP is replaced by an in-memory stub.
+"""
+
+import sys
+import os
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from open_notebook_client import OpenNotebookClient
+
+
+class StubClient(OpenNotebookClient):
+    """Client whose HTTP layer is an in-memory notebook store."""
+
+    def __init__(self):
+        super().__init__(base_url="http://stub")
+        self.sent = []
+        self.release = threading.Event()
+        self.fail_with = None
+        self.notebooks = []
+
+    def _send(self, method, endpoint, **kwargs):
+        self.sent.append((method, endpoint))
+        if method == "POST":
+            self.notebooks.append(kwargs["json"]["name"])
+            return {"name": kwargs["json"]["name"]}
+        snapshot = list(self.notebooks)
+        self.release.wait(5)
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+        return snapshot
+
+
+def run_threads(count, target):
+    """Start ``count`` threads on ``target``, give them time to join, return them."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    return threads
+
+
+def check_merged_calls():
+    client = StubClient()
+    results = []
+    threads = run_threads(10, lambda: results.append(client.list_notebooks()))
+    client.release.set()
+    for t in threads:
+        t.join()
+    assert client.sent == [("GET", "/notebooks")], client.sent
+    assert len(results) == 10
+    assert not client._inflight
+
+
+def check_errors_reach_every_waiter():
+    client = StubClient()
+    request = httpx.Request("GET", "http://stub/api/notebooks")
+    client.fail_with = httpx.HTTPStatusError(
+        "boom", request=request, response=httpx.Response(500, request=request))
+    errors = []
+
+    def call():
+        try:
+            client.list_notebooks()
+        except httpx.HTTPStatusError as e:
+            errors.append(e)
+
+    threads = run_threads(5, call)
+    client.release.set()
+    for t in threads:
+        t.join()
+    assert len(client.sent) == 1, client.sent
+    assert len(errors) == 5
+    assert all(e.response.status_code == 500 for e in errors)
+    assert len({id(e) for e in errors}) == 5
+
+
+def check_read_your_writes():
+    client = StubClient()
+    results = []
+    reader = run_threads(1, lambda: results.append(client.list_notebooks()))[0]
+
+    client.create_notebook("mine")
+    writer = run_threads(1, lambda: results.append(client.list_notebooks()))[0]
+    client.release.set()
+    reader.join()
+    writer.join()
+    assert client.sent.count(("GET", "/notebooks")) == 2, client.sent
+    assert ["mine"] in results, results
+
+
+def check_interrupted_leader():
+    client = StubClient()
+    client.fail_with = KeyboardInterrupt()
+    outcomes = []
+
+    def call():
+        try:
+            outcomes.append(client.list_notebooks())
+        except KeyboardInterrupt:
+            outcomes.append("interrupted")
+
+    threads = run_threads(5, call)
+    client.release.set()
+    for t in threads:
+        t.join(5)
+    assert not any(t.is_alive() for t in threads)
+    assert outcomes.count("interrupted") == 1, outcomes
+    assert outcomes.count([]) == 4, outcomes
+    assert not client._inflight
+
+
+def main():
+    checks = [
+        check_merged_calls,
+        check_errors_reach_every_waiter,
+        check_read_your_writes,
+        check_interrupted_leader,
+    ]
+    failed = 0
+    for check in checks:
+        try:
+            check()
+            print(f"ok    {check.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL  {check.__name__}: {e}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
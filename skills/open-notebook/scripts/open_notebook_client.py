@@ -6,12 +6,66 @@ Base client for interacting with Open Notebook API.
 
 import os
 import sys
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Tuple
 import httpx
 
 
+class _Call:
+    """A request in flight, shared by every caller waiting on the same result."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.aborted = False
+    
+    def run(self, fn, *args, **kwargs) -> Any:
+        """Run the request as the leader and publish its outcome to followers."""
+        try:
+            self.result = fn(*args, **kwargs)
+        except Exception as e:
+            self.error = e
+            raise
+        except BaseException:
+            # Interrupts belong to the leader's thread; followers retry instead
+            self.aborted = True
+            raise
+        finally:
+            self.done.set()
+        return self.result
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _fresh_error(error: Exception) -> Exception:
+    """Copy a shared exception so each thread raises it with its own traceback."""
+    try:
+        fresh = type(error).__new__(type(error), *error.args)
+        fresh.__dict__.update(error.__dict__)
+    except Exception:
+        return error.with_traceback(None)
+    fresh.__cause__ = error.__cause__
+    return fresh
+
+
+def _report_error(error: Exception) -> None:
+    """Print an HTTP failure to stderr."""
+    if isinstance(error, httpx.HTTPStatusError):
+        print(f"HTTP Error {error.response.status_code}: {error.response.text}", file=sys.stderr)
+    elif isinstance(error, httpx.RequestError):
+        print(f"Request Error: {error}", file=sys.stderr)
+
+
 class OpenNotebookClient:
-    """Client for Open Notebook API."""
+    """Client for Open Notebook API.
+    
+    Safe to share between threads: concurrent identical GET requests are
+    collapsed into a single HTTP call whose result is handed to every caller.
+    A GET never joins a request sent before the caller's own writes. Shared
+    results are the same object for every caller and must not be mutated.
+    """
     
     def __init__(self, base_url: Optional[str] = None, password: Optional[str] = None):
         self.base_url = (base_url or os.getenv("OPEN_NOTEBOOK_URL", "http://localhost:5055")).rstrip("/")
@@ -19,8 +73,61 @@ class OpenNotebookClient:
         self.headers = {}
         if self.password:
             self.headers["Authorization"] = f"Bearer {self.password}"
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple, _Call] = {}
+        self._write_gen = 0
     
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request to API, coalescing concurrent identical GETs."""
+        if method != "GET":
+            return self._write(method, endpoint, **kwargs)
+        params = kwargs.get("params") or {}
+        if (set(kwargs) - {"params"} or not isinstance(params, dict)
+                or not all(isinstance(v, _SCALARS) for v in params.values())):
+            return self._send(method, endpoint, **kwargs)
+        
+        while True:
+            with self._lock:
+                # The write generation keeps GETs from joining a request
+                # that was sent before a write this caller has seen finish
+                key = (self._write_gen, endpoint, tuple(sorted(params.items())))
+                call = self._inflight.get(key)
+                leader = call is None
+                if leader:
+                    call = self._inflight[key] = _Call()
+            
+            if leader:
+                try:
+                    return call.run(self._send, method, endpoint, **kwargs)
+                finally:
+                    self._forget(key, call)
+            
+            call.done.wait()
+            if call.aborted:
+                self._forget(key, call)
+                continue
+            if call.error is not None:
+                _report_error(call.error)
+                raise _fresh_error(call.error)
+            return call.result
+    
+    def _forget(self, key: Tuple, call: _Call) -> None:
+        """Drop a finished call so later GETs send a new request."""
+        with self._lock:
+            if self._inflight.get(key) is call:
+                del self._inflight[key]
+    
+    def _write(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Send a non-GET request, invalidating in-flight GETs around it."""
+        with self._lock:
+            self._write_gen += 1
+        try:
+            return self._send(method, endpoint, **kwargs)
+        finally:
+            with self._lock:
+                self._write_gen += 1
+    
+    def _send(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request to API."""
         url = f"{self.base_url}/api{endpoint}"
         headers = {**self.headers, **kwargs.pop("headers", {})}
@@ -30,11 +137,8 @@ class OpenNotebookClient:
                 response = client.request(method, url, headers=headers, **kwargs)
                 response.raise_for_status()
                 return response.json() if response.content else {}
-        except httpx.HTTPStatusError as e:
-            print(f"HTTP Error {e.response.status_code}: {e.response.text}", file=sys.stderr)
-            raise
-        except httpx.RequestError as e:
-            print(f"Request Error: {e}", file=sys.stderr)
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            _report_error(e)
             raise
     
     # Notebooks